@@ -0,0 +1,85 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+from libc.errno cimport errno, EINTR
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+from cpython.exc cimport PyErr_CheckSignals
+import os
+
+cdef extern from "unistd.h" nogil:
+    ssize_t write(int fd, const void *buf, size_t count)
+
+cdef enum:
+    BUF_SIZE = 1 << 20
+
+cdef int _write_all(int fd, const char *data, Py_ssize_t n) except -1:
+    cdef ssize_t w
+    while n > 0:
+        with nogil:
+            w = write(fd, data, n)
+        if w < 0:
+            if errno != EINTR:
+                raise OSError(errno, os.strerror(errno))
+            PyErr_CheckSignals()
+            continue
+        data += w
+        n -= w
+        if n > 0:
+            PyErr_CheckSignals()
+    return 0
+
+def write_combinations(int fd, list prefixes, bases, list suffixes, list tails,
+                       Py_ssize_t min_len, Py_ssize_t max_len):
+    cdef Py_ssize_t n_tails = len(tails)
+    cdef Py_ssize_t i, pos = 0, written = 0, core_len, core_size, lo, hi, tl, need
+    cdef const char *core_ptr
+    cdef const char **t_ptr = <const char **>malloc(n_tails * sizeof(char *) + 1)
+    cdef Py_ssize_t *t_size = <Py_ssize_t *>malloc(n_tails * sizeof(Py_ssize_t) + 1)
+    cdef Py_ssize_t *t_len = <Py_ssize_t *>malloc(n_tails * sizeof(Py_ssize_t) + 1)
+    cdef char *buf = <char *>malloc(BUF_SIZE)
+    cdef bytes core, pre, v, suf
+    cdef Py_ssize_t pre_len, v_len, suf_len
+    try:
+        if not t_ptr or not t_size or not t_len or not buf:
+            raise MemoryError()
+        for i in range(n_tails):
+            t, tl = tails[i]
+            t_ptr[i] = PyBytes_AS_STRING(t)
+            t_size[i] = PyBytes_GET_SIZE(t)
+            t_len[i] = tl
+        for variants in bases:
+            for pre, pre_len in prefixes:
+                for v, v_len in variants:
+                    for suf, suf_len in suffixes:
+                        core = pre + v + suf
+                        core_ptr = PyBytes_AS_STRING(core)
+                        core_size = PyBytes_GET_SIZE(core)
+                        core_len = pre_len + v_len + suf_len
+                        lo = min_len - core_len
+                        hi = max_len - core_len
+                        for i in range(n_tails):
+                            tl = t_len[i]
+                            if tl > hi:
+                                break
+                            if tl < lo:
+                                continue
+                            need = core_size + t_size[i]
+                            if pos + need > BUF_SIZE:
+                                _write_all(fd, buf, pos)
+                                pos = 0
+                            if need > BUF_SIZE:
+                                _write_all(fd, core_ptr, core_size)
+                                _write_all(fd, t_ptr[i], t_size[i])
+                            else:
+                                memcpy(buf + pos, core_ptr, core_size)
+                                memcpy(buf + pos + core_size, t_ptr[i], t_size[i])
+                                pos += need
+                            written += 1
+        if pos:
+            _write_all(fd, buf, pos)
+    finally:
+        free(t_ptr)
+        free(t_size)
+        free(t_len)
+        free(buf)
+    return written
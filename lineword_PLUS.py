@@ -1,23 +1,58 @@
 from __future__ import annotations
 import argparse
-import gzip
+import functools
+import hashlib
+import io
 import itertools
+import math
 import os
+import queue
 import random
+import re
+import shutil
 import sys
+import tempfile
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Set
+from typing import BinaryIO, Iterable, List, Optional, Set, Tuple
 try:
     from tqdm import tqdm
     HAS_TQDM = True
 except Exception:
     HAS_TQDM = False
+try:
+    import xxhash
+    HAS_XXHASH = True
+except Exception:
+    HAS_XXHASH = False
+try:
+    from isal import isal_zlib
+    HAS_ISAL = True
+except Exception:
+    HAS_ISAL = False
+try:
+    import _linewordfast
+    HAS_FASTPATH = True
+except Exception:
+    HAS_FASTPATH = False
 DEFAULT_BASE_WORDS = ["admin", "user", "password", "root", "login", "test", "guest"]
 DEFAULT_NUMBERS = ["", "1", "12", "123", "1234", "12345", "123456", "2020", "2021", "2022", "2023", "2024"]
 DEFAULT_SYMBOLS = ["", "!", "@", "#", "$", "%", "&", "*", "-", "_", "."]
 DEFAULT_SEPARATORS = ["", "", "", "", "-", "_"]
+IO_BUFFER_SIZE = 1 << 20
+IOV_MAX = 1024
+SHUFFLE_BUCKET_BITS = 8
+SHUFFLE_BUCKET_BUFFER = 1 << 16
+SHUFFLE_IN_MEMORY_MAX = 1 << 20
+HAS_WRITEV = hasattr(os, "writev")
+WINDOWS_MAX_WORKERS = 61
+HASH_IS_64BIT = sys.hash_info.width >= 64
 DEFAULT_LEET_MAP = {"a": ["a", "4", "@"], "e": ["e", "3"], "i": ["i", "1", "!"], "o": ["o", "0"], "s": ["s", "5", "$"], "t": ["t", "7"]}
+_SPLIT_RE = re.compile(r"[\-\._\s]+")
+_LEET = {c: tuple(sys.intern(x) for x in v) for c, v in DEFAULT_LEET_MAP.items()}
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Advanced wordlist generator (English-only).")
     p.add_argument("-i", "--input", help="Input file with base words (one per line). If omitted, interactive or defaults are used.")
@@ -36,6 +71,7 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--suffixes", nargs="*", default=["",], help="Suffixes to add")
     p.add_argument("--separators", nargs="*", default=None, help="Separators to use between word and number/symbol")
     p.add_argument("--limit", type=int, default=0, help="Stop after writing LIMIT entries (0 = no limit)")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes to split base words across (0 = all CPUs)")
     p.add_argument("--quiet", action="store_true", help="Minimal console output")
     p.add_argument("--interactive", action="store_true", help="Force interactive prompts to enter base words (overrides --input)")
     return p.parse_args()
@@ -45,7 +81,7 @@ def read_base_words(args: argparse.Namespace) -> List[str]:
         print("Enter base words separated by commas, or press Enter to use defaults:")
         s = input("> ").strip()
         if s:
-            return [w.strip() for w in s.split(",") if w.strip()]
+            return list(dict.fromkeys(w.strip() for w in s.split(",") if w.strip()))
         return DEFAULT_BASE_WORDS.copy()
     if args.input:
         p = Path(args.input)
@@ -53,53 +89,101 @@ def read_base_words(args: argparse.Namespace) -> List[str]:
             print(f"Input file not found: {p}", file=sys.stderr)
             sys.exit(2)
         with p.open("r", encoding="utf-8", errors="ignore") as f:
-            words = [line.strip() for line in f if line.strip()]
+            words = list(dict.fromkeys(line.strip() for line in f if line.strip()))
         return words if words else DEFAULT_BASE_WORDS.copy()
     if not sys.stdin.isatty():
         content = sys.stdin.read().strip()
         if content:
-            return [line.strip() for line in content.splitlines() if line.strip()]
+            return list(dict.fromkeys(line.strip() for line in content.splitlines() if line.strip()))
     return DEFAULT_BASE_WORDS.copy()
 
-def generate_leet_variants(word: str, leet_map: dict = DEFAULT_LEET_MAP, max_variants: int = 32) -> Iterable[str]:
-    letters = list(word.lower())
-    pools = []
-    for ch in letters:
-        pool = leet_map.get(ch, [ch])
-        pools.append(pool)
-    count = 0
-    for prod in itertools.product(*pools):
-        yield "".join(prod)
-        count += 1
-        if count >= max_variants:
-            return
+@functools.lru_cache(maxsize=4096)
+def _leet_variants(word: str, max_variants: int) -> Tuple[str, ...]:
+    pools = [_LEET.get(ch, (ch,)) for ch in word]
+    return tuple("".join(prod) for prod in itertools.islice(itertools.product(*pools), max_variants))
+def generate_leet_variants(word: str, leet_map: dict = DEFAULT_LEET_MAP, max_variants: int = 32) -> Tuple[str, ...]:
+    if leet_map is DEFAULT_LEET_MAP:
+        return _leet_variants(word.lower(), max_variants)
+    pools = [leet_map.get(ch, [ch]) for ch in word.lower()]
+    return tuple("".join(prod) for prod in itertools.islice(itertools.product(*pools), max_variants))
+def leet_variant_count(word: str, max_variants: int = 32) -> int:
+    return min(math.prod(len(_LEET.get(ch, (ch,))) for ch in word.lower()), max_variants)
+def _cases(word: str) -> Tuple[str, ...]:
+    lo = word.lower()
+    up = word.upper()
+    cap = word.capitalize()
+    out = [word]
+    if lo != word:
+        out.append(lo)
+    if up != word and up != lo:
+        out.append(up)
+    if cap != word and cap != lo and cap != up:
+        out.append(cap)
+    return tuple(out)
 def case_variants(word: str) -> List[str]:
-    variants = {word, word.lower(), word.upper(), word.capitalize()}
+    variants = list(_cases(word))
     if "-" in word or "_" in word:
         parts = [p for p in re_split(word) if p]
         if parts:
             camel = "".join(p.capitalize() for p in parts)
-            variants.add(camel)
-    return list(variants)
+            if camel not in variants:
+                variants.append(camel)
+    return variants
 def re_split(s: str) -> List[str]:
-    import re
-    return re.split(r"[\-\._\s]+", s)
+    return _SPLIT_RE.split(s)
 def build_dates(start: int, end: int) -> List[str]:
     years = [str(y) for y in range(start, end + 1)]
-    dates = []
-    for y in years:
-        dates.append(y)
-        dates.append(f"01{y}")
-        dates.append(f"{y}01")
-        dates.append("0101")
-        dates.append("1010")
-    seen = set()
-    out = []
-    for d in dates:
-        if d not in seen:
-            seen.add(d)
-            out.append(d)
-    return out
+    return list(dict.fromkeys(itertools.chain.from_iterable((y, f"01{y}", f"{y}01", "0101", "1010") for y in years)))
+def base_variants(base: str, use_leet: bool) -> Tuple[str, ...]:
+    variants = list(_cases(base))
+    if use_leet:
+        variants.extend(itertools.chain.from_iterable((lv, lv.capitalize()) for lv in generate_leet_variants(base)))
+    return tuple(dict.fromkeys(variants))
+def build_tails(numbers: List[str], symbols: List[str], separators: List[str],
+                year_tokens: List[str], mode: str) -> List[Tuple[str, int]]:
+    numbers = [num for num in numbers if num]
+    symbols = [sym for sym in symbols if sym]
+    tails = [""]
+    if mode == "basic":
+        tails.extend(sep + num for num in numbers for sep in separators)
+        tails.extend(year_tokens)
+    else:
+        tails.extend(symbols)
+        for sep in separators:
+            for num in numbers:
+                tails.append(sep + num)
+                tails.extend(sym + sep + num for sym in symbols)
+        for dt in year_tokens:
+            tails.append(dt)
+            tails.extend(dt + sym for sym in symbols)
+    return [(t, len(t)) for t in dict.fromkeys(tails)]
+def encode_tails(numbers: List[str], symbols: List[str], separators: List[str],
+                 year_tokens: List[str], mode: str) -> List[Tuple[bytes, int]]:
+    return sorted(((t.encode("utf-8", "ignore") + b"\n", tl)
+                   for t, tl in build_tails(numbers, symbols, separators, year_tokens, mode)),
+                  key=lambda x: x[1])
+def encode_tokens(tokens: Iterable[str]) -> List[Tuple[bytes, int]]:
+    return [(t.encode("utf-8", "ignore"), len(t)) for t in tokens]
+def write_native(
+    base_words: Iterable[str],
+    out_path: Path,
+    numbers: List[str],
+    symbols: List[str],
+    separators: List[str],
+    prefixes: List[str],
+    suffixes: List[str],
+    year_tokens: List[str],
+    use_leet: bool,
+    mode: str,
+    min_len: int,
+    max_len: int,
+) -> int:
+    tails = encode_tails(numbers, symbols, separators, year_tokens, mode)
+    pres = encode_tokens(prefixes)
+    sufs = encode_tokens(suffixes)
+    bases = (encode_tokens(base_variants(base, use_leet)) for base in base_words)
+    with open(out_path, "wb", buffering=0) as f:
+        return _linewordfast.write_combinations(f.fileno(), pres, bases, sufs, tails, min_len, max_len)
 def generate_combinations(
     base_words: Iterable[str],
     numbers: List[str],
@@ -112,73 +196,223 @@ def generate_combinations(
     mode: str,
     min_len: int,
     max_len: int,
-) -> Iterable[str]:
-    base_words = list(dict.fromkeys(w.strip() for w in base_words if w.strip()))
-    if not base_words:
-        return
+) -> Iterable[bytes]:
+    tails = encode_tails(numbers, symbols, separators, year_tokens, mode)
     for base in base_words:
-        variants = {base, base.lower(), base.upper(), base.capitalize()}
-        if use_leet:
-            for lv in generate_leet_variants(base):
-                variants.add(lv)
-                variants.add(lv.capitalize())
-        for v in list(variants):
-            for pre in prefixes:
-                for suf in suffixes:
-                    core = f"{pre}{v}{suf}"
-                    if mode == "basic":
-                        if min_len <= len(core) <= max_len:
-                            yield core
-                        for num in numbers:
-                            for sep in separators:
-                                c = f"{core}{sep}{num}" if num else core
-                                if min_len <= len(c) <= max_len:
-                                    yield c
-                        for dt in year_tokens:
-                            c = f"{core}{dt}"
-                            if min_len <= len(c) <= max_len:
-                                yield c
-                    else:
-                        if min_len <= len(core) <= max_len:
-                            yield core
-                        for sep in separators:
-                            for num in numbers:
-                                c = f"{core}{sep}{num}" if num else core
-                                if min_len <= len(c) <= max_len:
-                                    yield c
-                                for sym in symbols:
-                                    if sym:
-                                        c2 = f"{core}{sym}{sep}{num}" if num else f"{core}{sym}"
-                                        if min_len <= len(c2) <= max_len:
-                                            yield c2
-                        for dt in year_tokens:
-                            c = f"{core}{dt}"
-                            if min_len <= len(c) <= max_len:
-                                yield c
-                            for sym in symbols:
-                                if sym:
-                                    c2 = f"{core}{dt}{sym}"
-                                    if min_len <= len(c2) <= max_len:
-                                        yield c2
-def write_output(lines: Iterable[str], out_path: Path, unique: bool, limit: int, quiet: bool) -> int:
-    is_gz = out_path.suffix == ".gz"
-    open_func = gzip.open if is_gz else open
-    mode = "wt"
-    seen: Set[str] = set() if unique else set()
+        for parts in itertools.product(prefixes, base_variants(base, use_leet), suffixes):
+            core = "".join(parts)
+            core_len = len(core)
+            lo = min_len - core_len
+            hi = max_len - core_len
+            core_b = core.encode("utf-8", "ignore")
+            for tail, tl in tails:
+                if tl > hi:
+                    break
+                if tl >= lo:
+                    yield core_b + tail
+class ThreadedGzipWriter:
+    def __init__(self, out_path: Path, compresslevel: Optional[int] = None, depth: int = 8):
+        self._file = open(out_path, "wb", buffering=0)
+        if HAS_ISAL:
+            level = 1 if compresslevel is None else compresslevel
+            self._compressor = isal_zlib.compressobj(level, isal_zlib.DEFLATED, 31)
+        else:
+            level = 6 if compresslevel is None else compresslevel
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        self._raw_q: queue.Queue = queue.Queue(maxsize=depth)
+        self._out_q: queue.Queue = queue.Queue(maxsize=depth)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._threads = [threading.Thread(target=self._compress, daemon=True),
+                         threading.Thread(target=self._drain, daemon=True)]
+        for t in self._threads:
+            t.start()
+    def _compress(self) -> None:
+        while True:
+            block = self._raw_q.get()
+            if block is None:
+                break
+            if self._error is None:
+                try:
+                    out = self._compressor.compress(block)
+                    if out:
+                        self._out_q.put(out)
+                except BaseException as e:
+                    self._error = e
+        if self._error is None:
+            try:
+                self._out_q.put(self._compressor.flush())
+            except BaseException as e:
+                self._error = e
+        self._out_q.put(None)
+    def _drain(self) -> None:
+        fd = self._file.fileno()
+        while True:
+            block = self._out_q.get()
+            if block is None:
+                return
+            if self._error is None:
+                try:
+                    write_all(fd, block)
+                except BaseException as e:
+                    self._error = e
+    def write(self, data: bytes) -> int:
+        if self._error is not None:
+            raise self._error
+        self._raw_q.put(data)
+        return len(data)
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._raw_q.put(None)
+        for t in self._threads:
+            t.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+    def __enter__(self) -> "ThreadedGzipWriter":
+        return self
+    def __exit__(self, *exc) -> None:
+        self.close()
+def open_output(out_path: Path) -> BinaryIO:
+    if out_path.suffix == ".gz":
+        return ThreadedGzipWriter(out_path)
+    return open(out_path, "wb", buffering=0)
+def write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+def writev_all(fd: int, frags: List[bytes], total: int) -> None:
+    n = os.writev(fd, frags)
+    if n < total:
+        write_all(fd, b"".join(frags)[n:])
+def fingerprint(line: bytes) -> int:
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_intdigest(line)
+    if HASH_IS_64BIT:
+        return hash(line)
+    return int.from_bytes(hashlib.blake2b(line, digest_size=8).digest(), "little")
+def unique_lines(lines: Iterable[bytes]) -> Iterable[bytes]:
+    seen: Set[int] = set()
+    for line in lines:
+        h = fingerprint(line)
+        if h in seen:
+            continue
+        seen.add(h)
+        yield line
+def write_output(lines: Iterable[bytes], out_path: Path, unique: bool, limit: int, quiet: bool) -> int:
+    if unique:
+        lines = unique_lines(lines)
     written = 0
-    with open_func(out_path, mode, encoding="utf-8", errors="ignore") as f:
+    buf: List[bytes] = []
+    buf_bytes = 0
+    with open_output(out_path) as f:
+        fd = -1 if out_path.suffix == ".gz" else f.fileno()
+        max_frags = IOV_MAX if fd >= 0 and HAS_WRITEV else sys.maxsize
+        def flush() -> None:
+            if fd < 0:
+                f.write(b"".join(buf))
+            elif HAS_WRITEV:
+                writev_all(fd, buf, buf_bytes)
+            else:
+                write_all(fd, b"".join(buf))
         for line in lines:
-            if unique:
-                if line in seen:
-                    continue
-                seen.add(line)
-            f.write(line + "\n")
+            buf.append(line)
+            buf_bytes += len(line)
+            if len(buf) >= max_frags or buf_bytes >= IO_BUFFER_SIZE:
+                flush()
+                buf.clear()
+                buf_bytes = 0
             written += 1
             if not quiet and (written % 1000 == 0):
                 print(f"Wrote {written} entries...", end="\r", flush=True)
             if limit and written >= limit:
                 break
+        if buf:
+            flush()
     return written
+def max_entries(
+    base_words: Iterable[str],
+    numbers: List[str],
+    symbols: List[str],
+    separators: List[str],
+    prefixes: List[str],
+    suffixes: List[str],
+    year_tokens: List[str],
+    use_leet: bool,
+    mode: str,
+    min_len: int,
+    max_len: int,
+) -> int:
+    tails = build_tails(numbers, symbols, separators, year_tokens, mode)
+    variants = sum(len(_cases(base)) + (2 * leet_variant_count(base) if use_leet else 0) for base in base_words)
+    return variants * len(prefixes) * len(suffixes) * len(tails)
+def flush_bucket(path: Path, buf: List[bytes]) -> None:
+    with open(path, "ab") as f:
+        f.write(b"".join(buf))
+    buf.clear()
+def shuffle_lines(lines: Iterable[bytes], tmp_dir: Path) -> Iterable[bytes]:
+    paths = [tmp_dir / f"bucket{i}" for i in range(1 << SHUFFLE_BUCKET_BITS)]
+    bufs: List[List[bytes]] = [[] for _ in paths]
+    sizes = [0] * len(paths)
+    for line in lines:
+        k = random.getrandbits(SHUFFLE_BUCKET_BITS)
+        bufs[k].append(line)
+        sizes[k] += len(line)
+        if sizes[k] >= SHUFFLE_BUCKET_BUFFER:
+            flush_bucket(paths[k], bufs[k])
+            sizes[k] = 0
+    for p, buf in zip(paths, bufs):
+        if buf:
+            flush_bucket(p, buf)
+    random.shuffle(paths)
+    for p in paths:
+        if not p.exists():
+            continue
+        with open(p, "rb") as f:
+            chunk = f.readlines()
+        random.shuffle(chunk)
+        yield from chunk
+_WORKER_CONFIG: dict = {}
+def _init_worker(config: dict) -> None:
+    _WORKER_CONFIG.update(config)
+def write_generated(base_words: List[str], config: dict, out_path: Path, unique: bool, limit: int, quiet: bool) -> int:
+    if HAS_FASTPATH and not unique and not limit and out_path.suffix != ".gz":
+        return write_native(base_words, out_path, **config)
+    gen = generate_combinations(base_words=base_words, **config)
+    if HAS_TQDM and not quiet:
+        gen = tqdm(gen, desc="Generating", unit="items")
+    return write_output(gen, out_path, unique=unique, limit=limit, quiet=quiet)
+def _write_chunk(task: Tuple[List[str], str, bool]) -> int:
+    words, part_path, unique = task
+    return write_generated(words, _WORKER_CONFIG, Path(part_path), unique=unique, limit=0, quiet=True)
+def read_parts(parts: List[Path]) -> Iterable[bytes]:
+    for part in parts:
+        with open(part, "rb", buffering=IO_BUFFER_SIZE) as f:
+            yield from f
+def staging_dir(out_path: Path) -> Optional[str]:
+    if out_path.exists() and not out_path.is_file():
+        return None
+    parent = out_path.resolve().parent
+    if parent.is_dir() and os.access(parent, os.W_OK | os.X_OK):
+        return str(parent)
+    return None
+def write_parallel(base_words: List[str], config: dict, out_path: Path, unique: bool, jobs: int, quiet: bool) -> int:
+    size = -(-len(base_words) // jobs)
+    chunks = [base_words[i:i + size] for i in range(0, len(base_words), size)]
+    part_suffix = ".gz" if out_path.suffix == ".gz" and not unique else ".txt"
+    with tempfile.TemporaryDirectory(prefix="lineword-", dir=staging_dir(out_path)) as tmp_dir:
+        parts = [Path(tmp_dir) / f"part{i}{part_suffix}" for i in range(len(chunks))]
+        with ProcessPoolExecutor(max_workers=len(chunks), initializer=_init_worker, initargs=(config,)) as ex:
+            counts = list(ex.map(_write_chunk, [(c, str(p), unique) for c, p in zip(chunks, parts)]))
+        if unique:
+            return write_output(read_parts(parts), out_path, unique=True, limit=0, quiet=quiet)
+        with open(out_path, "wb") as dst:
+            for part in parts:
+                with open(part, "rb") as src:
+                    shutil.copyfileobj(src, dst, IO_BUFFER_SIZE)
+        return sum(counts)
 def estimate_count(base_words: List[str], numbers: List[str], symbols: List[str],
                    prefixes: List[str], suffixes: List[str], yrs: List[str], mode: str) -> int:
     bw = len(base_words)
@@ -196,7 +430,7 @@ def main():
     base_words = read_base_words(args)
     numbers = args.numbers if args.numbers is not None else DEFAULT_NUMBERS.copy()
     symbols = args.symbols if args.symbols is not None else DEFAULT_SYMBOLS.copy()
-    separators = args.separators if args.separators is not None else DEFAULT_SEPARATORS.copy()
+    separators = list(dict.fromkeys(args.separators if args.separators is not None else DEFAULT_SEPARATORS))
     prefixes = args.prefixes or [""]
     suffixes = args.suffixes or [""]
     if args.years:
@@ -214,11 +448,10 @@ def main():
         print(f"Estimated output size (rough): ~{estimate:,} entries")
         print("Writing to:", args.output)
         if args.shuffle:
-            print("Shuffle enabled (will buffer in memory).")
+            print("Shuffle enabled (large outputs buffer through temporary files).")
         if args.leet:
             print("Leet substitutions enabled.")
-    gen = generate_combinations(
-        base_words=base_words,
+    config = dict(
         numbers=numbers,
         symbols=symbols,
         separators=separators,
@@ -231,31 +464,40 @@ def main():
         max_len=max_len,
     )
     output_path = Path(args.output)
-    if args.shuffle or args.unique:
+    jobs = args.jobs or os.cpu_count() or 1
+    if sys.platform == "win32":
+        jobs = min(jobs, WINDOWS_MAX_WORKERS)
+    if jobs > 1 and len(base_words) > 1 and not args.shuffle and not args.limit:
         if not args.quiet:
-            print("Collecting generated entries into memory (might be large)...")
-        collected = []
+            print(f"Generating with {min(jobs, len(base_words))} worker processes...")
+        written = write_parallel(base_words, config, output_path, unique=args.unique, jobs=jobs, quiet=args.quiet)
+    elif args.shuffle:
+        gen = generate_combinations(base_words=base_words, **config)
         if HAS_TQDM and not args.quiet:
             gen_iter = tqdm(gen, desc="Generating", unit="items")
         else:
             gen_iter = gen
-        for item in gen_iter:
-            collected.append(item)
-            if args.limit and len(collected) >= args.limit * 2:
-                break
         if args.unique:
-            collected = list(dict.fromkeys(collected))
-        if args.shuffle:
-            random.shuffle(collected)
+            gen_iter = unique_lines(gen_iter)
+        bound = max_entries(base_words, **config)
         if args.limit:
-            collected = collected[: args.limit]
-        written = write_output(collected, output_path, unique=False, limit=0, quiet=args.quiet)
-    else:
-        if HAS_TQDM and not args.quiet:
-            gen_iter = tqdm(gen, desc="Generating", unit="items")
+            gen_iter = itertools.islice(gen_iter, args.limit * 2)
+            bound = min(args.limit * 2, bound)
+        if bound <= SHUFFLE_IN_MEMORY_MAX:
+            collected: List[Optional[bytes]] = [None] * bound
+            idx = 0
+            for item in gen_iter:
+                collected[idx] = item
+                idx += 1
+            del collected[idx:]
+            random.shuffle(collected)
+            written = write_output(collected, output_path, unique=False, limit=args.limit, quiet=args.quiet)
         else:
-            gen_iter = gen
-        written = write_output(gen_iter, output_path, unique=args.unique, limit=args.limit, quiet=args.quiet)
+            with tempfile.TemporaryDirectory(prefix="lineword-") as tmp_dir:
+                written = write_output(shuffle_lines(gen_iter, Path(tmp_dir)), output_path,
+                                       unique=False, limit=args.limit, quiet=args.quiet)
+    else:
+        written = write_generated(base_words, config, output_path, unique=args.unique, limit=args.limit, quiet=args.quiet)
     if not args.quiet:
         print(f"\nDone. Wrote {written} entries to {os.path.abspath(output_path)}")
 